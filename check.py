@@ -1,6 +1,9 @@
+import logging
 import socket
 import os
 
+logger = logging.getLogger(__name__)
+
 class NubDBClient:
     def __init__(self, host=None, port=6379):
         """
@@ -20,16 +23,21 @@ class NubDBClient:
         self.host = host
         self.port = port
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        
+        # Disable Nagle so small commands hit the wire immediately,
+        # and keep idle connections alive
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
         try:
             self.sock.connect((host, port))
-            print(f"✓ Connected to NubDB at {host}:{port}")
+            # Lazy %-formatting: no string is built unless INFO is enabled
+            logger.info("Connected to NubDB at %s:%d", host, port)
         except socket.gaierror:
             # Fallback to localhost if domain not resolved
-            print(f"✗ Could not resolve {host}, trying localhost...")
+            logger.warning("Could not resolve %s, trying localhost...", host)
             self.host = 'localhost'
             self.sock.connect((self.host, port))
-            print(f"✓ Connected to NubDB at {self.host}:{port}")
+            logger.info("Connected to NubDB at %s:%d", self.host, port)
     
     def set(self, key, value):
         cmd = f"SET {key} {value}\n"
@@ -56,6 +64,9 @@ class NubDBClient:
 
 # Usage examples
 if __name__ == "__main__":
+    # Demo keeps the connection messages visible; library users opt in
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
     # Will use db.nubcoder.com by default, or localhost if domain not resolved
     client = NubDBClient()
     
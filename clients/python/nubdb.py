@@ -29,15 +29,23 @@ class NubDB:
     def connect(self):
         """Establish connection to NubDB"""
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Disable Nagle so small commands hit the wire immediately,
+        # and keep idle connections alive
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         self.sock.connect((self.host, self.port))
-        self.file = self.sock.makefile('rw')
+        # Binary mode: readline() returns bytes without running the
+        # TextIOWrapper's per-character UTF-8 decoder
+        self.file = self.sock.makefile('rb')
+
+    def send_command_raw(self, command: str) -> bytes:
+        """Send command and get the raw response bytes"""
+        self.sock.sendall(command.encode('utf-8') + b'\n')
+        return self.file.readline().strip()
 
     def send_command(self, command: str) -> str:
         """Send command and get response"""
-        self.file.write(command + '\n')
-        self.file.flush()
-        response = self.file.readline().strip()
-        return response
+        return self.send_command_raw(command).decode('utf-8')
 
     def set(self, key: str, value: str, ttl: int = 0) -> bool:
         """
@@ -109,8 +117,8 @@ class NubDB:
         Returns:
             New value
         """
-        response = self.send_command(f'INCR {key}')
-        return int(response)
+        # int() parses bytes directly, no decode needed
+        return int(self.send_command_raw(f'INCR {key}'))
 
     def decr(self, key: str) -> int:
         """
@@ -122,8 +130,7 @@ class NubDB:
         Returns:
             New value
         """
-        response = self.send_command(f'DECR {key}')
-        return int(response)
+        return int(self.send_command_raw(f'DECR {key}'))
 
     def size(self) -> int:
         """
@@ -132,8 +139,7 @@ class NubDB:
         Returns:
             Number of keys
         """
-        response = self.send_command('SIZE')
-        return int(response.split()[0])
+        return int(self.send_command_raw('SIZE').split()[0])
 
     def clear(self) -> bool:
         """
@@ -16,6 +16,7 @@ Usage:
 """
 
 from .client import NubDB
+from .aclient import AsyncNubDB
 from .exceptions import (
     NubDBError,
     ConnectionError,
@@ -27,6 +28,7 @@ __version__ = "1.0.1"
 __author__ = "NubCoders"
 __all__ = [
     "NubDB",
+    "AsyncNubDB",
     "NubDBError",
     "ConnectionError",
     "TimeoutError",
@@ -0,0 +1,270 @@
+"""
+NubDB Python Client — asyncio variant.
+
+Multiplexes any number of in-flight commands over a single TCP
+connection: each command writes its bytes to the transport and awaits a
+Future that one reader task resolves in FIFO order, so concurrent tasks
+pipeline naturally without threads or extra sockets.
+"""
+
+import asyncio
+import os
+import socket
+from collections import deque
+from typing import Optional, Union
+
+from .client import NubDB as _SyncNubDB
+from .exceptions import ConnectionError, TimeoutError, CommandError
+
+
+class AsyncNubDB:
+    """
+    Asyncio client for the NubDB high-performance database.
+
+    Shares one TCP connection between arbitrarily many concurrent
+    tasks. Commands are written immediately (the transport coalesces
+    buffered writes per event-loop tick) and each caller awaits its
+    response Future, which the reader task resolves in submission order.
+
+    Args:
+        host: Server hostname. Defaults to NUBDB_HOST env var,
+              then 'localhost'.
+        port: Server port. Defaults to NUBDB_PORT env var,
+              then 6379.
+        timeout: Per-command timeout in seconds. Default 5.0.
+
+    Examples:
+        >>> async with AsyncNubDB() as db:
+        ...     await db.set("name", "Alice")
+        ...     print(await db.get("name"))
+
+        >>> db = AsyncNubDB()
+        >>> await db.connect()
+        >>> values = await asyncio.gather(*(db.get(k) for k in keys))
+        >>> await db.close()
+    """
+
+    DEFAULT_HOST = "localhost"
+    DEFAULT_PORT = 6379
+
+    def __init__(
+        self,
+        host: Optional[str] = None,
+        port: Optional[int] = None,
+        timeout: float = 5.0,
+    ):
+        self.host = host or os.getenv("NUBDB_HOST", self.DEFAULT_HOST)
+        self.port = port or int(os.getenv("NUBDB_PORT", str(self.DEFAULT_PORT)))
+        self.timeout = timeout
+
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: deque = deque()
+        self._connected = False
+
+    # ── Connection Management ─────────────────────────────────────
+
+    async def connect(self) -> None:
+        """Establish connection to the NubDB server."""
+        if self._connected:
+            return
+
+        try:
+            self._reader, self._writer = await asyncio.wait_for(
+                asyncio.open_connection(self.host, self.port),
+                self.timeout,
+            )
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(
+                f"Connection to {self.host}:{self.port} timed out"
+            ) from e
+        except socket.gaierror as e:
+            raise ConnectionError(
+                f"Could not resolve host '{self.host}': {e}"
+            ) from e
+        except OSError as e:
+            raise ConnectionError(
+                f"Could not connect to {self.host}:{self.port}: {e}"
+            ) from e
+
+        sock = self._writer.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+
+        self._connected = True
+        self._reader_task = asyncio.ensure_future(self._read_loop())
+
+    async def close(self) -> None:
+        """Close the connection to the NubDB server."""
+        self._connected = False
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except OSError:
+                pass
+            self._writer = None
+            self._reader = None
+
+    @property
+    def connected(self) -> bool:
+        """Whether the client is currently connected."""
+        return self._connected
+
+    async def _read_loop(self) -> None:
+        """
+        Resolve pending response Futures in FIFO order.
+
+        One response line per command, in submission order; on any read
+        error every waiter is failed so no task blocks forever.
+        """
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    raise ConnectionError("Server closed connection")
+                if self._pending:
+                    fut = self._pending.popleft()
+                    if not fut.done():
+                        fut.set_result(line.strip())
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._connected = False
+            while self._pending:
+                fut = self._pending.popleft()
+                if not fut.done():
+                    fut.set_exception(e)
+
+    # ── Command Execution ─────────────────────────────────────────
+
+    def _submit(self, data: bytes) -> "asyncio.Future":
+        """Queue a response Future and write command bytes."""
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append(fut)
+        self._writer.write(data)
+        return fut
+
+    async def _execute_raw(self, data: bytes) -> bytes:
+        """Send preassembled command bytes, await the raw response."""
+        if not self._connected:
+            await self.connect()
+        fut = self._submit(data)
+        try:
+            return await asyncio.wait_for(fut, self.timeout)
+        except asyncio.TimeoutError as e:
+            raise TimeoutError(f"Command timed out: {data!r}") from e
+
+    async def _execute(self, command: str) -> str:
+        """Send a command string, await the decoded response."""
+        raw = await self._execute_raw(command.encode("utf-8") + b"\n")
+        return raw.decode("utf-8")
+
+    # ── Database Commands ─────────────────────────────────────────
+
+    async def set(
+        self,
+        key: str,
+        value: Union[str, int, float],
+        ttl: Optional[int] = None,
+    ) -> bool:
+        """Set a key-value pair, optionally with a TTL in seconds."""
+        cmd = f"SET {key} {value}"
+        if ttl is not None and ttl > 0:
+            cmd += f" {ttl}"
+        return "OK" in await self._execute(cmd)
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get the value of a key, or None if it doesn't exist."""
+        raw = await self._execute_raw(b"GET " + key.encode("utf-8") + b"\n")
+        return _SyncNubDB._parse_value(raw)
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key."""
+        return "OK" in await self._execute(f"DELETE {key}")
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists."""
+        return (await self._execute(f"EXISTS {key}")).strip() == "1"
+
+    async def incr(self, key: str) -> int:
+        """Increment the integer value of a key by 1."""
+        response = await self._execute(f"INCR {key}")
+        try:
+            return int(response)
+        except ValueError:
+            raise CommandError(f"INCR failed: {response}")
+
+    async def decr(self, key: str) -> int:
+        """Decrement the integer value of a key by 1."""
+        response = await self._execute(f"DECR {key}")
+        try:
+            return int(response)
+        except ValueError:
+            raise CommandError(f"DECR failed: {response}")
+
+    async def size(self) -> int:
+        """Get the number of keys in the database."""
+        response = await self._execute("SIZE")
+        try:
+            return int(response.split()[0])
+        except (ValueError, IndexError):
+            return 0
+
+    async def clear(self) -> bool:
+        """Delete all keys from the database."""
+        return "OK" in await self._execute("CLEAR")
+
+    # ── Bulk Operations ───────────────────────────────────────────
+
+    async def mset(self, mapping: dict, ttl: Optional[int] = None) -> bool:
+        """Set multiple key-value pairs with one coalesced write."""
+        if not self._connected:
+            await self.connect()
+        loop = asyncio.get_running_loop()
+        futures = []
+        bufs = []
+        for key, value in mapping.items():
+            cmd = f"SET {key} {value}" + (f" {ttl}" if ttl else "")
+            bufs.append(cmd.encode("utf-8") + b"\n")
+            fut = loop.create_future()
+            self._pending.append(fut)
+            futures.append(fut)
+        # writelines() hands the transport the whole batch at once
+        self._writer.writelines(bufs)
+        responses = await asyncio.gather(*futures)
+        return all(b"OK" in raw for raw in responses)
+
+    async def mget(self, *keys: str) -> dict:
+        """Get multiple keys with one coalesced write."""
+        if not self._connected:
+            await self.connect()
+        futures = [self._submit(b"GET " + key.encode("utf-8") + b"\n")
+                   for key in keys]
+        responses = await asyncio.gather(*futures)
+        return {
+            key: _SyncNubDB._parse_value(raw)
+            for key, raw in zip(keys, responses)
+        }
+
+    # ── Context Manager ───────────────────────────────────────────
+
+    async def __aenter__(self) -> "AsyncNubDB":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        status = "connected" if self._connected else "disconnected"
+        return f"AsyncNubDB(host='{self.host}', port={self.port}, {status})"
@@ -5,12 +5,67 @@ Connects to a running NubDB server over TCP. Supports all NubDB commands
 with automatic reconnection, context manager usage, and clean error handling.
 """
 
+import functools
 import os
+import queue
 import socket
+import struct
+import sys
+import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from typing import Optional, Union
 
-from .exceptions import ConnectionError, TimeoutError, CommandError
+from .exceptions import NubDBError, ConnectionError, TimeoutError, CommandError
+
+# Precompiled command prefixes for the hot per-key commands, so each
+# call concatenates cached bytes instead of formatting and encoding a
+# fresh f-string (see NubDB._send_parts).
+_GET = b"GET "
+_SET = b"SET "
+_DELETE = b"DELETE "
+_EXISTS = b"EXISTS "
+_INCR = b"INCR "
+_DECR = b"DECR "
+_NL = b"\n"
+
+
+# Linux TCP_CORK / BSD TCP_NOPUSH: hold partial segments while a burst
+# of small commands is written, so they leave as full-size packets.
+_TCP_CORK = getattr(socket, "TCP_CORK", None)
+if _TCP_CORK is None:
+    _TCP_CORK = getattr(socket, "TCP_NOPUSH", None)
+
+
+@functools.lru_cache(maxsize=4096)
+def _enc_key(s: str) -> bytes:
+    """
+    Encode a key, caching the result.
+
+    Hot workloads hit the same keys over and over (counters, session
+    ids); caching the encoded bytes avoids a fresh allocation per
+    repeat. Safe to share since bytes are immutable. UTF-8 so
+    non-ASCII keys round-trip through the byte-oriented server, as
+    they always have.
+    """
+    return s.encode("utf-8")
+
+
+def clear_encode_cache() -> None:
+    """Drop all cached key encodings (frees at most a few KiB)."""
+    _enc_key.cache_clear()
+
+
+# Environment defaults, read once at import time instead of per
+# construction (pools and test suites build many clients). A
+# malformed NUBDB_PORT degrades to the default rather than breaking
+# the import.
+_ENV_HOST = os.getenv("NUBDB_HOST")
+try:
+    _ENV_PORT = int(os.getenv("NUBDB_PORT", "0")) or None
+except ValueError:
+    _ENV_PORT = None
 
 
 class NubDB:
@@ -28,6 +83,9 @@ class NubDB:
         auto_reconnect: Whether to automatically reconnect on
                         connection loss. Default True.
         max_retries: Max reconnection attempts. Default 3.
+        socket_options: Optional list of (level, optname, value) tuples
+                        applied to the socket before connecting, e.g.
+                        to add TCP_QUICKACK on Linux.
 
     Examples:
         >>> db = NubDB()
@@ -46,6 +104,13 @@ class NubDB:
     DEFAULT_HOST = "localhost"
     DEFAULT_PORT = 6379
     BUFFER_SIZE = 4096
+    READ_BUFFER_SIZE = 8192
+    MAX_PIPELINE_BYTES = 64 * 1024
+
+    # Class-wide pool of reusable read buffers: connections take one on
+    # connect and return it on close, capping total read-buffer memory
+    # at 64 * READ_BUFFER_SIZE no matter how many clients churn.
+    _buf_pool: queue.LifoQueue = queue.LifoQueue(maxsize=64)
 
     def __init__(
         self,
@@ -54,15 +119,45 @@ class NubDB:
         timeout: float = 5.0,
         auto_reconnect: bool = True,
         max_retries: int = 3,
+        socket_options: Optional[list] = None,
     ):
-        self.host = host or os.getenv("NUBDB_HOST", self.DEFAULT_HOST)
-        self.port = port or int(os.getenv("NUBDB_PORT", str(self.DEFAULT_PORT)))
+        self.host = host or _ENV_HOST or self.DEFAULT_HOST
+        self.port = port or _ENV_PORT or self.DEFAULT_PORT
         self.timeout = timeout
         self.auto_reconnect = auto_reconnect
         self.max_retries = max_retries
+        self.socket_options = socket_options or []
 
         self._sock: Optional[socket.socket] = None
         self._connected = False
+        # Set before connect() so finalization is safe (and O(1)) even
+        # if construction fails partway through.
+        self._closed = False
+
+        # Write-coalescing state: callers append command byte chunks to
+        # _write_chunks under _write_lock and queue a response slot; the
+        # caller that finds no flush in progress becomes the flusher,
+        # sends everything buffered in one scatter-gather write and
+        # reads the responses for every queued slot (see _submit).
+        self._write_lock = threading.Lock()
+        self._write_chunks: list = []
+        self._pending: deque = deque()
+        self._flushing = False
+
+        # Reusable receive buffer (see _readline_raw): responses are
+        # scanned in place instead of going through socket.makefile().
+        # Taken from the class-wide pool in connect().
+        self._rbuf: Optional[bytearray] = None
+        self._rpos = 0
+        self._rlen = 0
+
+        # Length-prefixed framing state (see _negotiate_binary_frames):
+        # when the server acks HELLO BIN, responses are read as a 4-byte
+        # length plus payload into these reusable buffers instead of
+        # scanning for newlines.
+        self._binary_frames = False
+        self._lenbuf = bytearray(4)
+        self._framebuf = bytearray(self.READ_BUFFER_SIZE)
 
         self.connect()
 
@@ -72,16 +167,35 @@ class NubDB:
         """Establish connection to the NubDB server."""
         if self._connected:
             return
+        self._closed = False
 
         try:
             self._sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self._sock.settimeout(self.timeout)
             self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # Size the kernel buffers to hold a full pipelined burst
+            self._sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_SNDBUF, self.MAX_PIPELINE_BYTES
+            )
+            self._sock.setsockopt(
+                socket.SOL_SOCKET, socket.SO_RCVBUF, self.MAX_PIPELINE_BYTES
+            )
+            for level, optname, value in self.socket_options:
+                self._sock.setsockopt(level, optname, value)
             self._sock.connect((self.host, self.port))
-            
-            # Wrap socket file object for buffered line reading
-            self._file = self._sock.makefile("r", encoding="utf-8")
+
+            # Fresh connection: take a pooled read buffer and discard
+            # any stale buffered bytes
+            if self._rbuf is None:
+                try:
+                    self._rbuf = self._buf_pool.get_nowait()
+                except queue.Empty:
+                    self._rbuf = bytearray(self.READ_BUFFER_SIZE)
+            self._rpos = 0
+            self._rlen = 0
             self._connected = True
+            self._negotiate_binary_frames()
         except socket.gaierror as e:
             self._cleanup_socket()
             raise ConnectionError(
@@ -99,7 +213,10 @@ class NubDB:
             ) from e
 
     def close(self) -> None:
-        """Close the connection to the NubDB server."""
+        """Close the connection to the NubDB server. Idempotent."""
+        if self._closed:
+            return
+        self._closed = True
         self._cleanup_socket()
 
     def ping(self) -> bool:
@@ -123,15 +240,20 @@ class NubDB:
     def _cleanup_socket(self) -> None:
         """Safely close and clean up the socket."""
         self._connected = False
-        
-        # Close file handle first
-        if hasattr(self, "_file") and self._file:
-            try:
-                self._file.close()
-            except OSError:
-                pass
-            self._file = None
-            
+        self._rpos = 0
+        self._rlen = 0
+
+        # Return the read buffer to the class-wide pool. Buffers that
+        # grew past the standard size are dropped, so pooled memory
+        # stays capped.
+        if self._rbuf is not None:
+            if len(self._rbuf) == self.READ_BUFFER_SIZE:
+                try:
+                    self._buf_pool.put_nowait(self._rbuf)
+                except queue.Full:
+                    pass
+            self._rbuf = None
+
         # Close socket
         if self._sock is not None:
             try:
@@ -140,6 +262,26 @@ class NubDB:
                 pass
             self._sock = None
 
+    def _negotiate_binary_frames(self) -> None:
+        """
+        Ask the server for length-prefixed response framing.
+
+        Servers that understand `HELLO BIN` ack with `OK BIN` and then
+        prefix every response with a 4-byte big-endian length, so reads
+        can recv exactly the payload instead of scanning each response
+        for a newline. Older servers answer with a plain error line,
+        which is consumed here, and the client stays in line mode.
+        """
+        self._binary_frames = False
+        try:
+            self._sock.sendall(b"HELLO BIN\n")
+            if self._readline_raw().strip() == b"OK BIN":
+                self._binary_frames = True
+        except OSError:
+            # Treat any hiccup as "no binary framing"; a real
+            # connection problem will surface on the first command.
+            pass
+
     def _reconnect(self) -> None:
         """Attempt to reconnect to the server."""
         self._cleanup_socket()
@@ -155,50 +297,300 @@ class NubDB:
 
     # ── Command Execution ─────────────────────────────────────────
 
+    class _Slot:
+        """A caller's reserved position in the response stream."""
+
+        __slots__ = ("count", "responses", "error", "done")
+
+        def __init__(self, count: int):
+            self.count = count
+            self.responses: Optional[list] = None
+            self.error: Optional[BaseException] = None
+            self.done = threading.Event()
+
+    def _submit(self, data, count: int = 1) -> list:
+        """
+        Queue command bytes for sending and return the matching responses.
+
+        `data` is either a bytes payload or an iterable of preencoded
+        chunks that are appended straight into the shared write buffer.
+
+        Concurrent callers append their bytes to a shared write buffer
+        and enqueue a response slot. The caller that finds no flush in
+        progress becomes the flusher: it repeatedly drains the buffer
+        with a single sendall(), reads one response line per queued
+        command (FIFO order matches submission order), and wakes the
+        waiting callers. Other callers just block on their slot.
+
+        This coalesces syscalls and TCP segments when several threads
+        issue commands at once; a single-threaded caller takes the same
+        path with exactly one sendall() as before.
+        """
+        slot = self._Slot(count)
+        with self._write_lock:
+            if isinstance(data, bytes):
+                self._write_chunks.append(data)
+            else:
+                # Iterable of preencoded chunks: queue them directly,
+                # no intermediate payload object.
+                self._write_chunks.extend(data)
+            self._pending.append(slot)
+            flusher = not self._flushing
+            if flusher:
+                self._flushing = True
+
+        if not flusher:
+            slot.done.wait()
+            if slot.error is not None:
+                raise slot.error
+            return slot.responses
+
+        while True:
+            with self._write_lock:
+                if not self._pending:
+                    self._flushing = False
+                    break
+                chunks = self._write_chunks
+                self._write_chunks = []
+                batch = list(self._pending)
+                self._pending.clear()
+
+            try:
+                self._send_buffers(chunks)
+                for queued in batch:
+                    queued.responses = self._read_responses(queued.count)
+                    queued.done.set()
+            except Exception as e:
+                # Fail everything in flight: the connection state is
+                # unknown, so waiting callers must not block forever.
+                with self._write_lock:
+                    batch.extend(self._pending)
+                    self._pending.clear()
+                    self._write_chunks.clear()
+                    self._flushing = False
+                for queued in batch:
+                    if not queued.done.is_set():
+                        queued.error = e
+                        queued.done.set()
+                break
+
+        if slot.error is not None:
+            raise slot.error
+        return slot.responses
+
+    # sendmsg() is limited to IOV_MAX iovecs per call (1024 on Linux);
+    # stay comfortably below it.
+    _SENDMSG_MAX_BUFFERS = 512
+
+    def _send_buffers(self, bufs: list) -> None:
+        """
+        Write a list of byte chunks with as few syscalls as possible,
+        without concatenating them first.
+
+        Uses sendmsg() scatter-gather where available, so a burst of
+        queued commands goes out in one syscall with no big
+        intermediate bytes object; partial sends advance through the
+        chunk list. Falls back to join + sendall() on platforms
+        without sendmsg (e.g. Windows).
+
+        Multi-command bursts are corked (TCP_CORK on Linux, TCP_NOPUSH
+        on BSD/macOS) for the duration of the write, so the kernel
+        packs them into max-size segments; uncorking afterwards flushes
+        the tail immediately, which matters because the caller reads
+        responses right after the burst.
+        """
+        cork = _TCP_CORK is not None and len(bufs) > 1
+        if cork:
+            try:
+                self._sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 1)
+            except OSError:
+                cork = False
+
+        try:
+            if not hasattr(self._sock, "sendmsg"):
+                self._sock.sendall(b"".join(bufs))
+                return
+
+            i = 0
+            n = len(bufs)
+            while i < n:
+                sent = self._sock.sendmsg(bufs[i:i + self._SENDMSG_MAX_BUFFERS])
+                # Advance past fully-sent chunks; re-slice a partial one.
+                while i < n and sent >= len(bufs[i]):
+                    sent -= len(bufs[i])
+                    i += 1
+                if sent and i < n:
+                    bufs[i] = memoryview(bufs[i])[sent:]
+        finally:
+            if cork:
+                try:
+                    self._sock.setsockopt(socket.IPPROTO_TCP, _TCP_CORK, 0)
+                except OSError:
+                    pass
+
+    def _send_parts_raw(self, *parts: bytes) -> bytes:
+        """
+        Send one command assembled from preencoded byte chunks and
+        return the undecoded response.
+
+        Fast path for the per-key commands: the chunks (cached prefix,
+        encoded key, newline) go straight into the shared write buffer,
+        so no intermediate command string or bytes object is built.
+        Handles auto-reconnect on connection loss.
+        """
+        if not self._connected or self._sock is None:
+            if self.auto_reconnect:
+                self._reconnect()
+            else:
+                raise ConnectionError("Not connected to NubDB server")
+
+        try:
+            return self._submit(parts)[0]
+        except socket.timeout as e:
+            raise TimeoutError(
+                f"Command timed out: {b''.join(parts)!r}"
+            ) from e
+        except (BrokenPipeError, OSError) as e:
+            self._connected = False
+            if self.auto_reconnect:
+                self._reconnect()
+                # Retry once after reconnect
+                try:
+                    return self._submit(parts)[0]
+                except OSError as retry_err:
+                    raise ConnectionError(
+                        f"Command failed after reconnect: {retry_err}"
+                    ) from retry_err
+            raise ConnectionError(f"Connection lost: {e}") from e
+
+    def _send_parts(self, *parts: bytes) -> str:
+        """Like _send_parts_raw, decoding the response for callers
+        that want a str."""
+        return self._send_parts_raw(*parts).decode("utf-8").strip()
+
     def _send_command(self, command: str) -> str:
         """
         Send a raw command string to the server and return the response.
 
         Handles auto-reconnect on connection loss.
         """
+        return self._send_parts((command + "\n").encode("utf-8"))
+
+    def _pipeline_commands(self, commands: list) -> list:
+        """
+        Send multiple command strings in one write and read responses
+        in order. Responses are returned as raw bytes.
+        """
+        if not commands:
+            return []
+        payload = ("\n".join(commands) + "\n").encode("utf-8")
+        return self._pipeline_raw(payload, len(commands))
+
+    def _pipeline_raw(self, payload: bytes, count: int) -> list:
+        """
+        Send a preassembled batch payload in one write and read its
+        `count` responses in order, as raw bytes.
+
+        All command bytes go out in a single sendall(), so a batch of N
+        commands costs one round-trip instead of N. Handles
+        auto-reconnect on connection loss, resending the whole batch
+        once after a successful reconnect.
+        """
         if not self._connected or self._sock is None:
             if self.auto_reconnect:
                 self._reconnect()
             else:
                 raise ConnectionError("Not connected to NubDB server")
 
-        data = (command + "\n").encode("utf-8")
-
         try:
-            self._sock.sendall(data)
-            
-            # Read line-buffered response
-            response = self._file.readline()
-            if not response:
-                 # EOF implies connection closed
-                raise BrokenPipeError("Server closed connection")
-                
-            return response.strip()
-            
+            return self._submit(payload, count)
         except socket.timeout as e:
-            raise TimeoutError(f"Command timed out: {command}") from e
+            raise TimeoutError(
+                f"Pipelined batch of {count} commands timed out"
+            ) from e
         except (BrokenPipeError, OSError) as e:
             self._connected = False
             if self.auto_reconnect:
                 self._reconnect()
                 # Retry once after reconnect
                 try:
-                    self._sock.sendall(data)
-                    response = self._file.readline()
-                    if not response:
-                         raise ConnectionError("Server closed connection immediately after reconnect")
-                    return response.strip()
+                    return self._submit(payload, count)
                 except OSError as retry_err:
                     raise ConnectionError(
-                        f"Command failed after reconnect: {retry_err}"
+                        f"Pipelined batch failed after reconnect: {retry_err}"
                     ) from retry_err
             raise ConnectionError(f"Connection lost: {e}") from e
 
+    def _readline_raw(self) -> bytes:
+        """
+        Read one newline-terminated response line as raw bytes.
+
+        Scans a reusable receive buffer filled via recv_into() instead
+        of going through socket.makefile(), so there is no TextIOWrapper,
+        no per-line decode state machine, and no per-call buffer
+        allocation. The buffer is compacted when a partial line sits at
+        its tail and doubled when a single line outgrows it.
+        """
+        buf = self._rbuf
+        while True:
+            nl = buf.find(b"\n", self._rpos, self._rlen)
+            if nl != -1:
+                line = bytes(buf[self._rpos:nl])
+                self._rpos = nl + 1
+                if self._rpos == self._rlen:
+                    self._rpos = 0
+                    self._rlen = 0
+                return line
+
+            if self._rpos > 0:
+                # Shift the partial line to the front to make room.
+                buf[: self._rlen - self._rpos] = buf[self._rpos:self._rlen]
+                self._rlen -= self._rpos
+                self._rpos = 0
+            elif self._rlen == len(buf):
+                # A single line outgrew the buffer: double it.
+                self._rbuf = buf = buf + bytes(len(buf))
+
+            n = self._sock.recv_into(memoryview(buf)[self._rlen:])
+            if n == 0:
+                raise BrokenPipeError("Server closed connection")
+            self._rlen += n
+
+    def _recv_exact(self, buf: bytearray, count: int) -> None:
+        """Fill exactly `count` bytes of `buf` from the socket."""
+        view = memoryview(buf)
+        got = 0
+        while got < count:
+            n = self._sock.recv_into(view[got:count])
+            if n == 0:
+                raise BrokenPipeError("Server closed connection")
+            got += n
+
+    def _read_frame(self) -> bytes:
+        """
+        Read one length-prefixed response (binary framing mode).
+
+        Reads a 4-byte big-endian length, then exactly that many payload
+        bytes into a reusable buffer — no newline scan, one allocation
+        only when a response outgrows the buffer.
+        """
+        self._recv_exact(self._lenbuf, 4)
+        (length,) = struct.unpack_from(">I", self._lenbuf)
+        if length > len(self._framebuf):
+            self._framebuf = bytearray(length)
+        self._recv_exact(self._framebuf, length)
+        return bytes(self._framebuf[:length])
+
+    def _read_response_raw(self) -> bytes:
+        """Read one response, framed or newline-terminated, as bytes."""
+        if self._binary_frames:
+            return self._read_frame()
+        return self._readline_raw()
+
+    def _read_responses(self, count: int) -> list:
+        """Read `count` raw responses from the server, in order."""
+        return [self._read_response_raw() for _ in range(count)]
+
     # ── Database Commands ─────────────────────────────────────────
 
     def set(
@@ -218,18 +610,23 @@ class NubDB:
         Returns:
             True if the operation succeeded.
         """
-        # Quote strings to handle spaces properly
+        # Encode the value once; a large str goes straight to bytes
+        # instead of being copied into an f-string and encoded again.
         if isinstance(value, str):
-            # Basic escaping: minimal implementation as server expects raw or quoted
-            # NubDB protocol seems loose. Let's send raw unless it has spaces?
-            # Actually Protocol says quoted strings are values. 
-            pass 
-            
-        cmd = f"SET {key} {value}"
+            value_bytes = value.encode("utf-8")
+        else:
+            value_bytes = str(value).encode("ascii")
+
         if ttl is not None and ttl > 0:
-            cmd += f" {ttl}"
-        response = self._send_command(cmd)
-        return "OK" in response
+            raw = self._send_parts_raw(
+                _SET, _enc_key(key), b" ", value_bytes,
+                b" ", str(ttl).encode("ascii"), _NL,
+            )
+        else:
+            raw = self._send_parts_raw(
+                _SET, _enc_key(key), b" ", value_bytes, _NL
+            )
+        return b"OK" in raw
 
     def get(self, key: str) -> Optional[str]:
         """
@@ -241,15 +638,28 @@ class NubDB:
         Returns:
             The value as a string, or None if the key doesn't exist.
         """
-        response = self._send_command(f"GET {key}")
-        if not response or "(nil)" in response or "not found" in response.lower():
+        return self._parse_value(
+            self._send_parts_raw(_GET, _enc_key(key), _NL)
+        )
+
+    @staticmethod
+    def _parse_value(raw: bytes) -> Optional[str]:
+        """
+        Parse a raw GET response into its value, at the bytes level.
+
+        (nil) and quote detection run on the undecoded bytes (0x22 is
+        '"'), so misses allocate no string at all and hits decode only
+        the value slice.
+        """
+        raw = raw.strip()
+        if not raw or b"(nil)" in raw or b"not found" in raw.lower():
             return None
-            
+
         # Strip quotes if present (NubDB returns "value")
-        if response.startswith('"') and response.endswith('"'):
-            return response[1:-1]
-            
-        return response
+        if len(raw) >= 2 and raw[0] == 0x22 and raw[-1] == 0x22:
+            return raw[1:-1].decode("utf-8")
+
+        return raw.decode("utf-8")
 
     def delete(self, key: str) -> bool:
         """
@@ -261,7 +671,7 @@ class NubDB:
         Returns:
             True if the key was deleted.
         """
-        response = self._send_command(f"DELETE {key}")
+        response = self._send_parts(_DELETE, _enc_key(key), _NL)
         return "OK" in response
 
     def exists(self, key: str) -> bool:
@@ -274,7 +684,7 @@ class NubDB:
         Returns:
             True if the key exists.
         """
-        response = self._send_command(f"EXISTS {key}")
+        response = self._send_parts(_EXISTS, _enc_key(key), _NL)
         return response.strip() == "1"
 
     def incr(self, key: str) -> int:
@@ -290,7 +700,7 @@ class NubDB:
         Raises:
             CommandError: If the value is not an integer.
         """
-        response = self._send_command(f"INCR {key}")
+        response = self._send_parts(_INCR, _enc_key(key), _NL)
         try:
             return int(response)
         except ValueError:
@@ -309,7 +719,7 @@ class NubDB:
         Raises:
             CommandError: If the value is not an integer.
         """
-        response = self._send_command(f"DECR {key}")
+        response = self._send_parts(_DECR, _enc_key(key), _NL)
         try:
             return int(response)
         except ValueError:
@@ -341,25 +751,58 @@ class NubDB:
 
     # ── Bulk Operations ───────────────────────────────────────────
 
-    def mset(self, mapping: dict) -> bool:
+    @contextmanager
+    def pipeline(self):
+        """
+        Run a bulk command sequence without per-operation timeouts.
+
+        settimeout() keeps the socket in non-blocking-plus-wait mode,
+        which adds a poll to every read — noticeable when a pipelined
+        batch does thousands of them. Inside this context the socket is
+        switched to plain blocking mode; the configured timeout is
+        restored on exit.
+
+        Examples:
+            >>> with db.pipeline():
+            ...     db.mset({"a": 1, "b": 2})
+            ...     values = db.mget("a", "b")
         """
-        Set multiple key-value pairs.
+        if not self._connected:
+            self.connect()
+        self._sock.settimeout(None)
+        try:
+            yield self
+        finally:
+            if self._sock is not None:
+                self._sock.settimeout(self.timeout)
+
+    def mset(self, mapping: dict, ttl: Optional[int] = None) -> bool:
+        """
+        Set multiple key-value pairs in a single round-trip.
+
+        All SET commands are pipelined into one socket write, so the
+        cost is one round-trip for the whole batch instead of one per key.
 
         Args:
             mapping: Dictionary of key-value pairs to set.
+            ttl: Optional time-to-live in seconds, applied to every key.
 
         Returns:
             True if all operations succeeded.
         """
-        success = True
-        for key, value in mapping.items():
-            if not self.set(key, value):
-                success = False
-        return success
+        commands = [
+            f"SET {key} {value}" + (f" {ttl}" if ttl else "")
+            for key, value in mapping.items()
+        ]
+        responses = self._pipeline_commands(commands)
+        return all(b"OK" in response for response in responses)
 
     def mget(self, *keys: str) -> dict:
         """
-        Get multiple keys at once.
+        Get multiple keys in a single round-trip.
+
+        All GET commands are pipelined into one socket write and the
+        responses read back in order.
 
         Args:
             keys: Variable number of key names.
@@ -367,7 +810,28 @@ class NubDB:
         Returns:
             Dictionary mapping keys to their values (None if missing).
         """
-        return {key: self.get(key) for key in keys}
+        result = {}
+        batch_keys = []
+        buf = bytearray()
+        for key in keys:
+            buf += _GET
+            buf += _enc_key(key)
+            buf += _NL
+            batch_keys.append(key)
+            # Keep each burst below the socket send buffer so a huge
+            # key list doesn't stall the write behind unread responses.
+            if len(buf) >= self.MAX_PIPELINE_BYTES:
+                responses = self._pipeline_raw(bytes(buf), len(batch_keys))
+                for k, raw in zip(batch_keys, responses):
+                    result[k] = self._parse_value(raw)
+                batch_keys = []
+                buf.clear()
+
+        if batch_keys:
+            responses = self._pipeline_raw(bytes(buf), len(batch_keys))
+            for k, raw in zip(batch_keys, responses):
+                result[k] = self._parse_value(raw)
+        return result
 
     # ── Context Manager ───────────────────────────────────────────
 
@@ -378,7 +842,10 @@ class NubDB:
         self.close()
 
     def __del__(self) -> None:
-        self.close()
+        # Skip already-closed clients (O(1) flag check) and interpreter
+        # shutdown, where socket teardown can raise spuriously.
+        if not getattr(self, "_closed", True) and not sys.is_finalizing():
+            self.close()
 
     def __repr__(self) -> str:
         status = "connected" if self._connected else "disconnected"
@@ -13,8 +13,12 @@ Usage:
     db.close()
 """
 
+import atexit
+import importlib.util
 import subprocess
 import os
+import sys
+from threading import Lock
 from typing import Optional, Union
 
 
@@ -23,22 +27,74 @@ class NubDBError(Exception):
     pass
 
 
+DEFAULT_NUBDT_PATH = "./zig-out/bin/nubdt"
+
+_tcp_client_class = None
+
+
+def _load_tcp_client():
+    """
+    Load the TCP client class from the bundled nubdb-python package.
+
+    Loaded by file path (rather than a plain import) so it works from a
+    repo checkout without installing the package, and without clashing
+    with this module's own 'nubdb' name.
+    """
+    global _tcp_client_class
+    if _tcp_client_class is None:
+        pkg_dir = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)),
+            "nubdb-python", "src", "nubdb",
+        )
+        spec = importlib.util.spec_from_file_location(
+            "_nubdb_tcp",
+            os.path.join(pkg_dir, "__init__.py"),
+            submodule_search_locations=[pkg_dir],
+        )
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["_nubdb_tcp"] = module
+        spec.loader.exec_module(module)
+        _tcp_client_class = module.NubDB
+    return _tcp_client_class
+
+
 class NubDB:
     """
     NubDB Python Client
-    
+
     Provides a high-level interface to interact with NubDB database.
-    Uses subprocess communication with the nubdt binary.
+
+    Prefers a direct TCP connection (via the nubdb-python client) when
+    no binary path is given or NUBDB_HOST is set, avoiding per-instance
+    process startup and pipe copies. Falls back to subprocess
+    communication with the nubdt binary for purely local use.
     """
-    
-    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt"):
+
+    def __new__(cls, nubdt_path: Optional[str] = None,
+                host: Optional[str] = None, port: Optional[int] = None):
+        explicit_host = host is not None or os.getenv("NUBDB_HOST")
+        if cls is NubDB and (nubdt_path is None or explicit_host):
+            try:
+                return _load_tcp_client()(host=host, port=port)
+            except Exception:
+                if explicit_host:
+                    raise
+                # No server reachable: fall back to subprocess mode
+                # against the local binary.
+        return super().__new__(cls)
+
+    def __init__(self, nubdt_path: Optional[str] = None,
+                 host: Optional[str] = None, port: Optional[int] = None):
         """
-        Initialize NubDB client.
-        
+        Initialize NubDB client in subprocess mode.
+
         Args:
             nubdt_path: Path to the nubdt executable
+            host: Unused in subprocess mode (TCP mode is selected in
+                  __new__ before this runs)
+            port: Unused in subprocess mode
         """
-        self.nubdt_path = nubdt_path
+        self.nubdt_path = nubdt_path or DEFAULT_NUBDT_PATH
         self.process = None
         self._start_process()
     
@@ -222,17 +278,58 @@ class NubDB:
 
 
 # Simple synchronous API for one-off operations
-def quick_set(key: str, value: Union[str, int, float], ttl: int = 0, 
-              nubdt_path: str = "./zig-out/bin/nubdt") -> bool:
-    """Quick set operation without keeping connection open"""
-    with NubDB(nubdt_path) as db:
-        return db.set(key, value, ttl)
+_POOL: dict = {}
+_POOL_LOCK = Lock()
+
+
+def _is_dead(client) -> bool:
+    """Whether a pooled client's backing process has exited."""
+    process = getattr(client, "process", None)
+    if process is not None:
+        return process.poll() is not None
+    # TCP client from nubdb-python: it reconnects on demand
+    return False
+
+
+def _get_client(nubdt_path: Optional[str] = None) -> "NubDB":
+    """
+    Shared long-lived client for the quick_* helpers, keyed by path.
+
+    Thread-safe; a client whose backing process has died is replaced
+    transparently on the next call.
+    """
+    key = nubdt_path or ""
+    with _POOL_LOCK:
+        client = _POOL.get(key)
+        if client is None or _is_dead(client):
+            client = NubDB(nubdt_path)
+            _POOL[key] = client
+        return client
+
+
+def _close_all() -> None:
+    """Close every pooled client at interpreter shutdown."""
+    with _POOL_LOCK:
+        for client in _POOL.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _POOL.clear()
+
+
+atexit.register(_close_all)
+
+
+def quick_set(key: str, value: Union[str, int, float], ttl: int = 0,
+              nubdt_path: Optional[str] = None) -> bool:
+    """Quick set operation using a shared cached connection"""
+    return _get_client(nubdt_path).set(key, value, ttl)
 
 
-def quick_get(key: str, nubdt_path: str = "./zig-out/bin/nubdt") -> Optional[str]:
-    """Quick get operation without keeping connection open"""
-    with NubDB(nubdt_path) as db:
-        return db.get(key)
+def quick_get(key: str, nubdt_path: Optional[str] = None) -> Optional[str]:
+    """Quick get operation using a shared cached connection"""
+    return _get_client(nubdt_path).get(key)
 
 
 if __name__ == "__main__":
@@ -3,110 +3,430 @@ NubDB Python Client - Simple File-based Communication
 
 This client uses a simpler approach: writes commands to stdin and reads from stdout.
 Works with the existing NubDB binary without modifications.
+
+Typed fast paths: callers that know their value types can use
+set_str/set_int/set_float to skip the per-call type dispatch, and
+get_int to read counters without the quote-stripping pass. The generic
+set()/get() dispatch to the same code.
 """
 
+import asyncio
+import collections
+import functools
+import queue
 import subprocess
 import os
+import threading
 import time
+from contextlib import contextmanager
 from typing import Optional, Union
 
 
+class NubDBError(Exception):
+    """Raised when the database process misbehaves or disappears"""
+
+
+# Reserved key used to frame responses (see NubDB._read_framed): every
+# command is followed by a GET of this key, and its reply — a nonce
+# unique to the process — marks the end of that command's output.
+_MARKER_KEY = "__nubdb_frame__"
+_MARKER_CMD = f"GET {_MARKER_KEY}\n".encode("ascii")
+
+# Sentinel distinguishing "not cached" from a cached None (a GET miss)
+_CACHE_MISS = object()
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_path(path: str) -> str:
+    """Verify the binary path once; repeat constructions skip the stat"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"NubDB binary not found at {path}")
+    return path
+
+
 class NubDB:
-    """NubDB Python Client using direct command execution"""
-    
-    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt"):
+    """NubDB Python Client using a persistent database process"""
+
+    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt",
+                 cache_size: int = 128):
         """Initialize NubDB client"""
-        self.nubdt_path = nubdt_path
-        if not os.path.exists(self.nubdt_path):
-            raise FileNotFoundError(f"NubDB binary not found at {self.nubdt_path}")
-    
-    def _execute(self, command: str) -> str:
-        """Execute a single command and return the result"""
-        # Create a temporary command file
-        cmd_input = f"{command}\nQUIT\n"
-        
-        result = subprocess.run(
+        # _proc first: if path resolution raises, __del__ still finds a
+        # consistent instance and close() stays a silent no-op
+        self._proc = None
+        self.nubdt_path = _resolve_path(nubdt_path)
+        # LRU over recent GET/EXISTS/SIZE results; writes invalidate the
+        # affected entries. Note the cache does not observe TTL expiry,
+        # so a get() of a key set with a TTL may briefly return a value
+        # the database has already expired.
+        self._cache = collections.OrderedDict()
+        self._cache_max = cache_size
+        self._start_process()
+
+    def _cache_get(self, entry):
+        """Return the cached result for entry, or _CACHE_MISS"""
+        value = self._cache.get(entry, _CACHE_MISS)
+        if value is not _CACHE_MISS:
+            self._cache.move_to_end(entry)
+        return value
+
+    def _cache_put(self, entry, value):
+        self._cache[entry] = value
+        self._cache.move_to_end(entry)
+        while len(self._cache) > self._cache_max:
+            self._cache.popitem(last=False)
+
+    def _invalidate(self, key: str):
+        """Drop cached reads made stale by a write to key"""
+        self._cache.pop(("get", key), None)
+        self._cache.pop(("exists", key), None)
+        self._cache.pop(("size",), None)
+
+    def _start_process(self):
+        """
+        Spawn one long-lived nubdt child shared by all commands.
+
+        Every command used to fork+exec a fresh process and replay the
+        WAL; keeping one child alive turns each operation into a pipe
+        write plus a pipe read.
+        """
+        # Binary pipes: commands are encoded once on write and replies
+        # decoded once at the API boundary, instead of running the
+        # incremental UTF-8 codec over every chunk in both directions
+        self._proc = subprocess.Popen(
             [self.nubdt_path],
-            input=cmd_input,
-            capture_output=True,
-            text=True,
-            timeout=5
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-        
-        # Parse output - skip headers and prompts
-        lines = result.stdout.strip().split('\n')
-        for i, line in enumerate(lines):
-            if line.startswith('>'):
-                # Found a response line, get the next one
-                if i + 1 < len(lines):
-                    response = lines[i + 1]
-                    if not response.startswith('>'):
-                        return response.strip()
-        
-        return ""
+        # Consume the startup banner
+        for line in self._proc.stdout:
+            if b"Database ready" in line:
+                break
+
+        # Frame marker: store a per-process nonce under the reserved
+        # key so its GET reply is unambiguous even when a real response
+        # happens to be identical text like OK or (nil).
+        self._nonce = os.urandom(8).hex()
+        self._marker_reply = f'"{self._nonce}"'.encode("ascii")
+        self._prime_marker()
+
+    def _prime_marker(self):
+        """(Re)store the frame marker key. CLEAR wipes it, so callers
+        that clear the database must re-prime. The priming SET is
+        itself framed, so any notice it triggers is drained too."""
+        self._proc.stdin.write(
+            f'SET {_MARKER_KEY} "{self._nonce}"\n'.encode("ascii") + _MARKER_CMD)
+        self._proc.stdin.flush()
+        self._read_framed(self._proc.stdout)
+
+    @staticmethod
+    def _read_response(stdout) -> bytes:
+        """
+        Read the next response line, skipping prompts and blank lines.
+
+        The interactive prompt is printed as '> ' without a newline, so
+        a response typically arrives as '> OK' on one line; strip any
+        leading prompt markers before returning.
+        """
+        while True:
+            line = stdout.readline()
+            if not line:
+                raise NubDBError("Database process closed its output")
+            line = line.strip()
+            while line.startswith(b'>'):
+                line = line[1:].lstrip()
+            if line:
+                return line
+
+    def _read_framed(self, stdout) -> bytes:
+        """
+        Read one marker-framed response.
+
+        Every command we send is followed by a GET of the marker key,
+        so a command's output is everything up to the nonce reply. The
+        first line is the command's result; anything between it and the
+        marker (asynchronous notices such as 'Syncing ... to disk') is
+        drained here instead of being misread as the next response.
+        """
+        response = None
+        while True:
+            line = self._read_response(stdout)
+            if line == self._marker_reply:
+                return response if response is not None else b""
+            if response is None:
+                response = line
+            elif line == b"(nil)":
+                # CLEAR wipes the marker key, so until _prime_marker
+                # runs again its GET answers (nil); with the response
+                # already in hand that can only be the frame boundary.
+                return response
+
+    def _execute(self, command: str) -> bytes:
+        """Send a command to the persistent process and return the result"""
+        if self._proc is None or self._proc.poll() is not None:
+            self._start_process()
+
+        self._proc.stdin.write(command.encode("utf-8") + b"\n" + _MARKER_CMD)
+        self._proc.stdin.flush()
+        result = self._read_framed(self._proc.stdout)
+        if command.split(None, 1)[0].upper() == "CLEAR":
+            self._prime_marker()
+        return result
+
+    # Cap on bytes written before the replies are drained. Writing an
+    # unbounded batch in one go deadlocks once the child's unread
+    # stdout fills its 64 KiB pipe: the child blocks on writing
+    # replies, stops reading stdin, and we block in write(). Replies
+    # are smaller than their commands, so a 32 KiB burst keeps the
+    # return pipe comfortably below capacity.
+    MAX_PIPELINE_BYTES = 32 * 1024
+
+    def _execute_many(self, commands: list) -> list:
+        """
+        Submit commands in large bursts, draining the raw (bytes)
+        replies between bursts.
+
+        The submission/completion split amortizes the pipe write across
+        a whole burst: the child starts working on command 2 while we
+        read the reply to command 1, instead of strict lockstep. Bursts
+        are capped at MAX_PIPELINE_BYTES so the unread replies can
+        never fill the pipe and deadlock the batch.
+        """
+        if not commands:
+            return []
+        if self._proc is None or self._proc.poll() is not None:
+            self._start_process()
+
+        # Batches can contain arbitrary writes, so drop all cached reads
+        self._cache.clear()
+
+        stdin, stdout = self._proc.stdin, self._proc.stdout
+        results = []
+        buf = bytearray()
+        pending = 0
+        for cmd in commands:
+            buf += cmd.encode("utf-8")
+            buf += b"\n"
+            buf += _MARKER_CMD
+            pending += 1
+            if len(buf) >= self.MAX_PIPELINE_BYTES:
+                stdin.write(buf)
+                stdin.flush()
+                results.extend(
+                    self._read_framed(stdout) for _ in range(pending))
+                buf = bytearray()
+                pending = 0
+        if pending:
+            stdin.write(buf)
+            stdin.flush()
+            results.extend(self._read_framed(stdout) for _ in range(pending))
+
+        if any(cmd.split(None, 1)[0].upper() == "CLEAR" for cmd in commands):
+            self._prime_marker()
+        return results
+
+    def close(self):
+        """Shut down the persistent database process cleanly"""
+        if self._proc is not None and self._proc.poll() is None:
+            try:
+                self._proc.stdin.write(b"QUIT\n")
+                self._proc.stdin.flush()
+                self._proc.wait(timeout=2)
+            except Exception:
+                self._proc.terminate()
+                try:
+                    self._proc.wait(timeout=1)
+                except Exception:
+                    pass
+        self._proc = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        self.close()
     
-    def set(self, key: str, value: Union[str, int, float], ttl: int = 0) -> bool:
-        """Set a key-value pair"""
-        value_str = str(value)
-        # Quote strings with spaces
-        if ' ' in value_str or isinstance(value, str):
-            value_str = f'"{value_str}"'
-        
-        cmd = f'SET {key} {value_str}'
+    @staticmethod
+    def _encode_set(key: str, value: Union[str, int, float],
+                    ttl: int = 0) -> str:
+        """
+        Build a SET command, specialized by value type.
+
+        Numbers go on the wire bare; only strings pay for the quoting
+        (and escaping, when needed) pass.
+        """
+        vtype = type(value)
+        if vtype is int or vtype is float:
+            cmd = f'SET {key} {value}'
+        else:
+            value_str = str(value)
+            if '"' in value_str:
+                value_str = value_str.replace('"', '\\"')
+            cmd = f'SET {key} "{value_str}"'
         if ttl > 0:
             cmd += f' {ttl}'
-        
-        response = self._execute(cmd)
-        return response == "OK"
-    
-    def get(self, key: str) -> Optional[str]:
-        """Get a value by key"""
+        return cmd
+
+    def set_str(self, key: str, value: str, ttl: int = 0) -> bool:
+        """SET fast path for str values: straight-line quoting"""
+        if '"' in value:
+            value = value.replace('"', '\\"')
+        cmd = f'SET {key} "{value}"'
+        if ttl > 0:
+            cmd += f' {ttl}'
+        self._invalidate(key)
+        return self._execute(cmd) == b"OK"
+
+    def set_int(self, key: str, value: int, ttl: int = 0) -> bool:
+        """SET fast path for int values: no quoting or escaping"""
+        cmd = f'SET {key} {value}'
+        if ttl > 0:
+            cmd += f' {ttl}'
+        self._invalidate(key)
+        return self._execute(cmd) == b"OK"
+
+    def set_float(self, key: str, value: float, ttl: int = 0) -> bool:
+        """SET fast path for float values: no quoting or escaping"""
+        cmd = f'SET {key} {value}'
+        if ttl > 0:
+            cmd += f' {ttl}'
+        self._invalidate(key)
+        return self._execute(cmd) == b"OK"
+
+    # Built once at class-creation time; set() pays a single dict
+    # lookup instead of an isinstance chain per call
+    _SET_DISPATCH = {str: set_str, int: set_int, float: set_float}
+
+    def set(self, key: str, value: Union[str, int, float], ttl: int = 0) -> bool:
+        """Set a key-value pair (one dict lookup picks the fast path)"""
+        handler = self._SET_DISPATCH.get(value.__class__)
+        if handler is not None:
+            return handler(self, key, value, ttl)
+        self._invalidate(key)
+        return self._execute(self._encode_set(key, value, ttl)) == b"OK"
+
+    def get_int(self, key: str) -> Optional[int]:
+        """
+        GET fast path for integer values (counters).
+
+        Parses the bytes reply directly, skipping the quote handling;
+        returns None for a missing key and raises ValueError if the
+        stored value is not an integer.
+        """
+        cached = self._cache_get(("get", key))
+        if cached is not _CACHE_MISS:
+            return None if cached is None else int(cached)
+
         response = self._execute(f"GET {key}")
-        if response == "(nil)":
+        if response == b"(nil)":
+            self._cache_put(("get", key), None)
             return None
-        # Remove quotes if present
-        if response.startswith('"') and response.endswith('"'):
-            return response[1:-1]
-        return response
-    
+        value = int(response)
+        self._cache_put(("get", key), str(value))
+        return value
+
+    def set_many(self, pairs, ttl: int = 0) -> bool:
+        """
+        Set many key-value pairs in one pipe write.
+
+        Accepts a mapping or an iterable of (key, value) tuples and
+        returns True only if every SET was acknowledged.
+        """
+        if hasattr(pairs, "items"):
+            pairs = pairs.items()
+        commands = [self._encode_set(k, v, ttl) for k, v in pairs]
+        if not commands:
+            return True
+        return all(r == b"OK" for r in self._execute_many(commands))
+
+    def get(self, key: str) -> Optional[str]:
+        """Get a value by key (cached until the key is written)"""
+        cached = self._cache_get(("get", key))
+        if cached is not _CACHE_MISS:
+            return cached
+
+        response = self._execute(f"GET {key}")
+        if response == b"(nil)":
+            value = None
+        # Remove quotes if present; decode only what reaches the caller
+        elif response.startswith(b'"') and response.endswith(b'"'):
+            value = response[1:-1].decode("utf-8")
+        else:
+            value = response.decode("utf-8")
+        self._cache_put(("get", key), value)
+        return value
+
     def delete(self, key: str) -> bool:
         """Delete a key"""
+        self._invalidate(key)
         response = self._execute(f"DELETE {key}")
-        return response == "OK"
-    
+        return response == b"OK"
+
     def exists(self, key: str) -> bool:
-        """Check if a key exists"""
-        response = self._execute(f"EXISTS {key}")
-        return response == "1"
-    
+        """Check if a key exists (cached until the key is written)"""
+        if key == _MARKER_KEY:
+            # The frame marker is an implementation detail, not a
+            # user key
+            return False
+        cached = self._cache_get(("exists", key))
+        if cached is not _CACHE_MISS:
+            return cached
+
+        result = self._execute(f"EXISTS {key}") == b"1"
+        self._cache_put(("exists", key), result)
+        return result
+
     def incr(self, key: str) -> int:
         """Increment a key's value"""
+        self._invalidate(key)
         response = self._execute(f"INCR {key}")
         try:
-            return int(response)
+            value = int(response)
         except ValueError:
             return 0
-    
+        # The new value is known, so refresh the cache instead of
+        # leaving the next get() to pay a round-trip
+        self._cache_put(("get", key), str(value))
+        self._cache_put(("exists", key), True)
+        return value
+
     def decr(self, key: str) -> int:
         """Decrement a key's value"""
+        self._invalidate(key)
         response = self._execute(f"DECR {key}")
         try:
-            return int(response)
+            value = int(response)
         except ValueError:
             return 0
-    
+        self._cache_put(("get", key), str(value))
+        self._cache_put(("exists", key), True)
+        return value
+
     def size(self) -> int:
-        """Get number of keys"""
+        """Get number of keys (cached until the next write)"""
+        cached = self._cache_get(("size",))
+        if cached is not _CACHE_MISS:
+            return cached
+
         response = self._execute("SIZE")
         try:
-            return int(response.split()[0])
+            value = int(response.split()[0])
         except (ValueError, IndexError):
             return 0
-    
+        # Don't count the always-present frame marker key as the
+        # user's data
+        value = max(value - 1, 0)
+        self._cache_put(("size",), value)
+        return value
+
     def clear(self) -> bool:
         """Clear all keys"""
+        self._cache.clear()
         response = self._execute("CLEAR")
-        return response == "OK"
+        return response == b"OK"
 
 
 class NubDBBatch:
@@ -115,26 +435,35 @@ class NubDBBatch:
     Executes multiple commands in a single database session.
     """
     
-    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt"):
+    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt",
+                 client: Optional[NubDB] = None):
         self.nubdt_path = nubdt_path
         self.commands = []
+        # Reuse the caller's persistent client when given; otherwise
+        # lazily spawn (and keep) one of our own on first execute().
+        self._client = client
     
     def set(self, key: str, value: Union[str, int, float], ttl: int = 0):
         """Add SET command to batch"""
-        value_str = str(value)
-        if ' ' in value_str or isinstance(value, str):
-            value_str = f'"{value_str}"'
-        
-        cmd = f'SET {key} {value_str}'
-        if ttl > 0:
-            cmd += f' {ttl}'
-        self.commands.append(cmd)
+        self.commands.append(NubDB._encode_set(key, value, ttl))
         return self
     
     def get(self, key: str):
         """Add GET command to batch"""
         self.commands.append(f"GET {key}")
         return self
+
+    @staticmethod
+    def parse_value(response: str) -> Optional[str]:
+        """
+        Parse a raw GET response from execute() into the value
+        NubDB.get would return: None for (nil), quotes stripped.
+        """
+        if response == "(nil)":
+            return None
+        if response.startswith('"') and response.endswith('"'):
+            return response[1:-1]
+        return response
     
     def delete(self, key: str):
         """Add DELETE command to batch"""
@@ -152,44 +481,304 @@ class NubDBBatch:
         return self
     
     def execute(self) -> list:
-        """Execute all batched commands and return results"""
+        """Execute all batched commands against the persistent process"""
         if not self.commands:
             return []
-        
-        cmd_input = '\n'.join(self.commands) + '\nQUIT\n'
-        
-        result = subprocess.run(
-            [self.nubdt_path],
-            input=cmd_input,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
-        
-        # Parse all responses
-        lines = result.stdout.strip().split('\n')
-        responses = []
-        
-        for line in lines:
-            if not line.startswith('>') and not line.startswith('NubDB') and \
-               not line.startswith('Initializing') and not line.startswith('Replaying') and \
-               not line.startswith('Database ready') and not line.startswith('Syncing') and \
-               not line.startswith('Goodbye') and line.strip():
-                responses.append(line.strip())
-        
+
+        if self._client is None:
+            self._client = NubDB(self.nubdt_path)
+
+        responses = self._client._execute_many(self.commands)
         self.commands = []  # Clear for reuse
-        return responses
+        return [r.decode("utf-8") for r in responses]
+
+
+class NubDBPool:
+    """
+    Pool of persistent NubDB clients for concurrent workloads.
+
+    Each pooled client owns its own long-lived nubdt process, so
+    threads don't serialize on a single child's pipe, and process
+    startup is amortized across every request the pool ever serves.
+
+    Usage:
+        pool = NubDBPool(min_size=2, max_size=8)
+        with pool.acquire() as db:
+            db.set("key", "value")
+
+        # Batches should borrow from the pool too, instead of
+        # spawning their own process:
+        with pool.acquire() as db:
+            NubDBBatch(client=db).set("a", 1).set("b", 2).execute()
+    """
+
+    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt",
+                 min_size: int = 2, max_size: int = 8):
+        self.nubdt_path = nubdt_path
+        self.max_size = max_size
+        self._idle = queue.Queue(maxsize=max_size)
+        self._created = 0
+        self._lock = threading.Lock()
+        for _ in range(min(min_size, max_size)):
+            self._idle.put(NubDB(nubdt_path))
+            self._created += 1
+
+    @contextmanager
+    def acquire(self):
+        """Borrow a healthy client; it returns to the pool on exit"""
+        client = self._checkout()
+        try:
+            yield client
+        finally:
+            self._release(client)
+
+    def _checkout(self) -> NubDB:
+        try:
+            client = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._created < self.max_size:
+                    self._created += 1
+                    return NubDB(self.nubdt_path)
+            # At capacity: block until a client is released
+            client = self._idle.get()
+        return self._ensure_healthy(client)
+
+    def _ensure_healthy(self, client: NubDB) -> NubDB:
+        """Verify the child still answers; respawn it if not"""
+        try:
+            int(client._execute("SIZE").split()[0])
+            return client
+        except Exception:
+            client.close()
+            return NubDB(self.nubdt_path)
+
+    def _release(self, client: NubDB):
+        try:
+            self._idle.put_nowait(client)
+        except queue.Full:
+            client.close()
+
+    def close(self):
+        """Close every idle pooled client"""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncNubDB:
+    """
+    Asyncio client sharing one persistent nubdt process.
+
+    Commands are written as soon as they are issued and completed in
+    submission order by a single reader task, so concurrent callers
+    overlap their round-trips instead of serializing on them:
+
+        db = await AsyncNubDB.connect()
+        values = await asyncio.gather(*(db.get(k) for k in keys))
+        await db.close()
+    """
+
+    def __init__(self, nubdt_path: str = "./zig-out/bin/nubdt"):
+        self._proc = None
+        self.nubdt_path = _resolve_path(nubdt_path)
+        self._pending = collections.deque()
+        self._reader_task = None
+
+    @classmethod
+    async def connect(cls, nubdt_path: str = "./zig-out/bin/nubdt"):
+        """Create a client and start its database process"""
+        client = cls(nubdt_path)
+        await client.start()
+        return client
+
+    async def start(self):
+        """Spawn the child, consume the banner, prime the frame marker"""
+        self._proc = await asyncio.create_subprocess_exec(
+            self.nubdt_path,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        while True:
+            line = await self._proc.stdout.readline()
+            if not line or b"Database ready" in line:
+                break
+
+        self._nonce = os.urandom(8).hex()
+        self._marker_reply = f'"{self._nonce}"'
+        self._proc.stdin.write(
+            f'SET {_MARKER_KEY} "{self._nonce}"\n'.encode() + _MARKER_CMD)
+        await self._proc.stdin.drain()
+        await self._read_frame()
+
+        self._reader_task = asyncio.get_running_loop().create_task(
+            self._reader())
+
+    async def _read_frame(self) -> str:
+        """Read one marker-framed response (see NubDB._read_framed)"""
+        response = None
+        while True:
+            raw = await self._proc.stdout.readline()
+            if not raw:
+                raise NubDBError("Database process closed its output")
+            line = raw.decode().strip()
+            while line.startswith('>'):
+                line = line[1:].lstrip()
+            if not line:
+                continue
+            if line == self._marker_reply:
+                return response if response is not None else ""
+            if response is None:
+                response = line
+            elif line == "(nil)":
+                # Marker key wiped by CLEAR; see NubDB._read_framed
+                return response
+
+    async def _reader(self):
+        """Complete pending futures in submission order"""
+        try:
+            while True:
+                result = await self._read_frame()
+                fut = self._pending.popleft()
+                if not fut.done():
+                    fut.set_result(result)
+        except Exception as exc:
+            # A broken pipe fails every in-flight command, not just the
+            # one the reader was parsing
+            while self._pending:
+                fut = self._pending.popleft()
+                if not fut.done():
+                    fut.set_exception(NubDBError(str(exc)))
+
+    async def _execute(self, command: str) -> str:
+        if self._proc is None:
+            await self.start()
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append(fut)
+        self._proc.stdin.write(command.encode("utf-8") + b"\n" + _MARKER_CMD)
+        await self._proc.stdin.drain()
+        return await fut
+
+    async def set(self, key: str, value: Union[str, int, float],
+                  ttl: int = 0) -> bool:
+        """Set a key-value pair"""
+        value_str = str(value)
+        if ' ' in value_str or isinstance(value, str):
+            value_str = f'"{value_str}"'
+        cmd = f'SET {key} {value_str}'
+        if ttl > 0:
+            cmd += f' {ttl}'
+        return await self._execute(cmd) == "OK"
+
+    async def get(self, key: str) -> Optional[str]:
+        """Get a value by key"""
+        response = await self._execute(f"GET {key}")
+        if response == "(nil)":
+            return None
+        if response.startswith('"') and response.endswith('"'):
+            return response[1:-1]
+        return response
+
+    async def delete(self, key: str) -> bool:
+        """Delete a key"""
+        return await self._execute(f"DELETE {key}") == "OK"
+
+    async def exists(self, key: str) -> bool:
+        """Check if a key exists"""
+        if key == _MARKER_KEY:
+            # The frame marker is an implementation detail, not a
+            # user key
+            return False
+        return await self._execute(f"EXISTS {key}") == "1"
+
+    async def incr(self, key: str) -> int:
+        """Increment a key's value"""
+        try:
+            return int(await self._execute(f"INCR {key}"))
+        except ValueError:
+            return 0
+
+    async def decr(self, key: str) -> int:
+        """Decrement a key's value"""
+        try:
+            return int(await self._execute(f"DECR {key}"))
+        except ValueError:
+            return 0
+
+    async def size(self) -> int:
+        """Get number of keys"""
+        try:
+            value = int((await self._execute("SIZE")).split()[0])
+        except (ValueError, IndexError):
+            return 0
+        # Don't count the always-present frame marker key
+        return max(value - 1, 0)
+
+    async def clear(self) -> bool:
+        """Clear all keys (and re-prime the frame marker)"""
+        result = await self._execute("CLEAR")
+        await self._execute(f'SET {_MARKER_KEY} "{self._nonce}"')
+        return result == "OK"
+
+    async def get_many(self, keys) -> list:
+        """Fetch many keys with their round-trips in flight together"""
+        return list(await asyncio.gather(*(self.get(k) for k in keys)))
+
+    async def close(self):
+        """Shut down the database process and fail in-flight commands"""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        if self._proc is not None and self._proc.returncode is None:
+            try:
+                self._proc.stdin.write(b"QUIT\n")
+                await self._proc.stdin.drain()
+                await asyncio.wait_for(self._proc.wait(), timeout=2)
+            except Exception:
+                self._proc.terminate()
+        self._proc = None
+        while self._pending:
+            fut = self._pending.popleft()
+            if not fut.done():
+                fut.set_exception(NubDBError("Client closed"))
+
+    async def __aenter__(self):
+        if self._proc is None:
+            await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
 
 
 # Convenience functions
+@functools.lru_cache(maxsize=8)
+def _shared_client(nubdt_path: str = "./zig-out/bin/nubdt") -> NubDB:
+    """
+    One persistent client per binary path, shared by the quick_*
+    helpers so repeat calls reuse the running child instead of
+    spawning a database per call.
+    """
+    return NubDB(nubdt_path)
+
+
 def quick_set(key: str, value: Union[str, int, float], ttl: int = 0) -> bool:
-    """Quick set without keeping client instance"""
-    return NubDB().set(key, value, ttl)
+    """Quick set without managing a client instance"""
+    return _shared_client().set(key, value, ttl)
 
 
 def quick_get(key: str) -> Optional[str]:
-    """Quick get without keeping client instance"""
-    return NubDB().get(key)
+    """Quick get without managing a client instance"""
+    return _shared_client().get(key)
 
 
 if __name__ == "__main__":
@@ -198,43 +787,46 @@ if __name__ == "__main__":
     print("╚════════════════════════════════════════╝\n")
     
     db = NubDB()
-    
+    # One batch per section: a single pipe write covers every command
+    # in the section instead of one round-trip each
+    batch = NubDBBatch(client=db)
+
     # Test SET and GET
     print("1. Testing SET and GET:")
-    db.set("name", "Alice")
-    db.set("age", 30)
-    db.set("city", "New York")
-    print(f"   name = {db.get('name')}")
-    print(f"   age = {db.get('age')}")
-    print(f"   city = {db.get('city')}")
-    
+    results = (batch.set("name", "Alice").set("age", 30)
+                    .set("city", "New York")
+                    .get("name").get("age").get("city").execute())
+    print(f"   name = {batch.parse_value(results[3])}")
+    print(f"   age = {batch.parse_value(results[4])}")
+    print(f"   city = {batch.parse_value(results[5])}")
+
     # Test EXISTS
     print("\n2. Testing EXISTS:")
     print(f"   'name' exists: {db.exists('name')}")
     print(f"   'unknown' exists: {db.exists('unknown')}")
-    
+
     # Test counters
     print("\n3. Testing INCR/DECR:")
-    db.set("counter", 100)
-    print(f"   Initial: {db.get('counter')}")
-    print(f"   After INCR: {db.incr('counter')}")
-    print(f"   After INCR: {db.incr('counter')}")
-    print(f"   After DECR: {db.decr('counter')}")
-    
+    results = (batch.set("counter", 100).get("counter")
+                    .incr("counter").incr("counter").decr("counter").execute())
+    print(f"   Initial: {results[1]}")
+    print(f"   After INCR: {results[2]}")
+    print(f"   After INCR: {results[3]}")
+    print(f"   After DECR: {results[4]}")
+
     # Test SIZE
     print(f"\n4. Total keys: {db.size()}")
-    
+
     # Test DELETE
     print("\n5. Testing DELETE:")
     db.delete("city")
     print(f"   'city' exists after delete: {db.exists('city')}")
     print(f"   Total keys: {db.size()}")
-    
+
     # Test batch operations
     print("\n6. Testing Batch Operations:")
-    batch = NubDBBatch()
     batch.set("user:1", "Alice").set("user:2", "Bob").set("user:3", "Charlie")
     results = batch.execute()
     print(f"   Batch results: {results}")
-    
+
     print("\n✓ All tests completed!")
@@ -8,12 +8,24 @@ This demonstrates basic usage of NubDB from Python using simple subprocess calls
 import subprocess
 import sys
 
+# Startup/shutdown noise that is not part of a command's response;
+# one startswith(tuple) call tests all prefixes at C level
+_BANNERS = ("NubDB", "Initializing", "Replay", "Database ready",
+            "Syncing", "Goodbye", "Compaction")
+
 def nubdb_command(cmd):
     """Execute a single NubDB command and return result"""
-    full_cmd = f'echo "{cmd}" | ../zig-out/bin/nubdt 2>/dev/null | grep -v "NubDB" | grep -v "Initializing" | grep -v "Replaying" | grep -v "Database ready" | grep -v "^>" | grep -v "Syncing" | grep -v "Goodbye" | tail -1'
-    
-    result = subprocess.run(full_cmd, shell=True, capture_output=True, text=True, timeout=2)
-    return result.stdout.strip()
+    # close_fds=False keeps subprocess on the posix_spawn fast path
+    result = subprocess.run(["../zig-out/bin/nubdt"], input=f"{cmd}\nQUIT\n",
+                            capture_output=True, text=True, timeout=2,
+                            close_fds=False)
+
+    responses = []
+    for line in result.stdout.splitlines():
+        line = line.strip().lstrip('> ')
+        if line and not line.startswith(_BANNERS):
+            responses.append(line)
+    return responses[-1] if responses else ""
 
 def main():
     print("=== NubDB Python Example ===\n")
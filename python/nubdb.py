@@ -1,43 +1,81 @@
 """
 NubDB Python Client - Simple and Fast
 
-This version uses echo to pipe commands directly to nubdt.
+This version pipes commands directly to nubdt via stdin.
 Perfect for single operations or scripts.
 """
 
+import functools
 import subprocess
 import os
+import threading
 from typing import Optional, Union
 
 
+# Startup/shutdown noise emitted by nubdt that is not part of a
+# command's response
+# "Replay" covers both "Replaying AOF log..." and "Replayed N
+# operations in X.XXms"
+_BANNER_PREFIXES = (
+    "NubDB", "Initializing", "Replay", "Database ready",
+    "Syncing", "Goodbye", "Compaction",
+)
+
+
+@functools.lru_cache(maxsize=8)
+def _resolve_path(path: str) -> str:
+    """Verify the binary path once; repeat constructions skip the stat"""
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"NubDB binary not found: {path}")
+    return path
+
+
+def _clean_lines(lines):
+    """
+    Yield response lines with prompt markers and banner noise removed.
+
+    Accepts a captured output string or any iterable of lines, so a
+    pipe can be streamed through it while the child is still running.
+    """
+    if isinstance(lines, str):
+        lines = lines.splitlines()
+    for line in lines:
+        line = line.strip()
+        while line.startswith('>'):
+            line = line[1:].lstrip()
+        if line and not line.startswith(_BANNER_PREFIXES):
+            yield line
+
+
 class NubDB:
     """Simple NubDB Python Client"""
     
     def __init__(self, nubdt_path: str = "../zig-out/bin/nubdt"):
         """Initialize client with path to nubdt binary"""
-        self.nubdt_path = nubdt_path
-        if not os.path.exists(self.nubdt_path):
-            raise FileNotFoundError(f"NubDB binary not found: {self.nubdt_path}")
+        self.nubdt_path = _resolve_path(nubdt_path)
     
     def _run_command(self, command: str) -> str:
-        """Execute a command using echo pipe"""
-        cmd = f'echo -e "{command}\\nQUIT" | timeout 2 {self.nubdt_path} 2>/dev/null | grep -v "^>" | grep -v "NubDB" | grep -v "Initializing" | grep -v "Replaying" | grep -v "Database ready" | grep -v "Syncing" | grep -v "Goodbye" | grep -v "Compaction" | tail -n 1'
-        
+        """Execute a command by piping it straight to nubdt's stdin"""
+        # close_fds=False lets CPython spawn the child via posix_spawn
+        # instead of fork+exec, skipping the copy-on-write page-table
+        # setup for the whole parent heap on every call
         result = subprocess.run(
-            cmd,
-            shell=True,
+            [self.nubdt_path],
+            input=f"{command}\nQUIT\n",
             capture_output=True,
             text=True,
-            timeout=3
+            timeout=3,
+            close_fds=False
         )
-        
-        return result.stdout.strip()
+
+        lines = list(_clean_lines(result.stdout))
+        return lines[-1] if lines else ""
     
     def set(self, key: str, value: Union[str, int, float], ttl: int = 0) -> bool:
         """Set a key-value pair"""
         value_str = str(value).replace('"', '\\"')
-        
-        cmd = f'SET {key} \\"{value_str}\\"'
+
+        cmd = f'SET {key} "{value_str}"'
         if ttl > 0:
             cmd += f' {ttl}'
         
@@ -92,21 +130,66 @@ class NubDB:
             return 0
 
 
+def run_batch(commands: list, db_path: str = "../zig-out/bin/nubdt") -> list:
+    """
+    Run many commands through one nubdt process.
+
+    One spawn amortized over the whole list instead of one per
+    command; returns the cleaned response lines in command order.
+    Responses are parsed as nubdt produces them rather than buffering
+    the whole output, so parsing overlaps the child's execution and
+    peak memory stays flat for large batches.
+    """
+    proc = subprocess.Popen(
+        [db_path],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        close_fds=False
+    )
+    payload = "\n".join(commands) + "\nQUIT\n"
+
+    # Feed stdin from a helper thread while this thread streams the
+    # replies; writing the whole payload up front would deadlock once
+    # a large batch's unread replies fill the pipe
+    def _feed():
+        try:
+            proc.stdin.write(payload)
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    writer = threading.Thread(target=_feed, daemon=True)
+    writer.start()
+    responses = list(_clean_lines(proc.stdout))
+    proc.stdout.close()
+    proc.wait(timeout=3)
+    writer.join(timeout=3)
+    return responses
+
+
 # Quick one-off functions
-def set_key(key: str, value: Union[str, int, float], ttl: int = 0, 
+@functools.lru_cache(maxsize=8)
+def _client(db_path: str) -> NubDB:
+    """One client per binary path, reused across the quick functions"""
+    return NubDB(db_path)
+
+
+def set_key(key: str, value: Union[str, int, float], ttl: int = 0,
             db_path: str = "../zig-out/bin/nubdt") -> bool:
     """Quick set operation"""
-    return NubDB(db_path).set(key, value, ttl)
+    return _client(db_path).set(key, value, ttl)
 
 
 def get_key(key: str, db_path: str = "../zig-out/bin/nubdt") -> Optional[str]:
     """Quick get operation"""
-    return NubDB(db_path).get(key)
+    return _client(db_path).get(key)
 
 
 def delete_key(key: str, db_path: str = "../zig-out/bin/nubdt") -> bool:
     """Quick delete operation"""
-    return NubDB(db_path).delete(key)
+    return _client(db_path).delete(key)
 
 
 if __name__ == "__main__":
@@ -115,40 +198,59 @@ if __name__ == "__main__":
     print("╚═══════════════════════════════════════════════╝\n")
     
     db = NubDB()
-    
-    # Basic operations
+
+    # Each numbered section runs as one batch: a single nubdt spawn
+    # covers all of its commands instead of one spawn per call
     print("1. SET operations:")
-    print(f"   SET name Alice: {db.set('name', 'Alice')}")
-    print(f"   SET age 30: {db.set('age', 30)}")
-    print(f"   SET city 'New York': {db.set('city', 'New York')}")
-    
+    results = run_batch([
+        'SET name "Alice"',
+        'SET age 30',
+        'SET city "New York"',
+    ], db.nubdt_path)
+    print(f"   SET name Alice: {results[0] == 'OK'}")
+    print(f"   SET age 30: {results[1] == 'OK'}")
+    print(f"   SET city 'New York': {results[2] == 'OK'}")
+
     print("\n2. GET operations:")
-    print(f"   GET name: {db.get('name')}")
-    print(f"   GET age: {db.get('age')}")
-    print(f"   GET city: {db.get('city')}")
-    
+    name, age, city = run_batch(
+        ['GET name', 'GET age', 'GET city'], db.nubdt_path)
+    print(f"   GET name: {name}")
+    print(f"   GET age: {age}")
+    print(f"   GET city: {city}")
+
     print("\n3. EXISTS operations:")
-    print(f"   EXISTS name: {db.exists('name')}")
-    print(f"   EXISTS unknown: {db.exists('unknown')}")
-    
+    known, unknown = run_batch(
+        ['EXISTS name', 'EXISTS unknown'], db.nubdt_path)
+    print(f"   EXISTS name: {known == '1'}")
+    print(f"   EXISTS unknown: {unknown == '1'}")
+
     print("\n4. Counter operations:")
-    db.set("counter", 100)
-    print(f"   Initial: {db.get('counter')}")
-    print(f"   INCR: {db.incr('counter')}")
-    print(f"   INCR: {db.incr('counter')}")
-    print(f"   DECR: {db.decr('counter')}")
-    print(f"   Current: {db.get('counter')}")
-    
+    results = run_batch([
+        'SET counter 100',
+        'GET counter',
+        'INCR counter',
+        'INCR counter',
+        'DECR counter',
+        'GET counter',
+    ], db.nubdt_path)
+    print(f"   Initial: {results[1]}")
+    print(f"   INCR: {results[2]}")
+    print(f"   INCR: {results[3]}")
+    print(f"   DECR: {results[4]}")
+    print(f"   Current: {results[5]}")
+
     print("\n5. SIZE:")
     print(f"   Total keys: {db.size()}")
-    
+
     print("\n6. DELETE:")
-    print(f"   DELETE city: {db.delete('city')}")
-    print(f"   EXISTS city: {db.exists('city')}")
-    print(f"   Total keys: {db.size()}")
-    
+    deleted, still_there, size = run_batch(
+        ['DELETE city', 'EXISTS city', 'SIZE'], db.nubdt_path)
+    print(f"   DELETE city: {deleted == 'OK'}")
+    print(f"   EXISTS city: {still_there == '1'}")
+    print(f"   Total keys: {size.split()[0]}")
+
     print("\n7. Quick functions:")
     set_key("quick_test", "hello")
     print(f"   quick_get('quick_test'): {get_key('quick_test')}")
-    
+
     print("\n✓ All tests completed successfully!")
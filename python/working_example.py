@@ -5,47 +5,62 @@ Working NubDB Python Example - Batch Mode
 This demonstrates the simplest working approach to use NubDB from Python.
 """
 
+import re
 import subprocess
-import tempfile
 import os
+import threading
+
+# One compiled pattern over all the startup/shutdown noise: a single C
+# regex call per line instead of a chain of substring scans
+_BANNER_RE = re.compile(
+    r"^(?:>|NubDB|Initializing|Replay|Database ready|Syncing|Goodbye|Compaction)"
+)
 
 def execute_nubdb_batch(commands):
     """
     Execute multiple NubDB commands in a batch.
     Returns list of responses.
     """
-    # Create temporary command file
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-        for cmd in commands:
-            f.write(cmd + '\n')
-        f.write('QUIT\n')
-        batch_file = f.name
-    
-    try:
-        # Execute NubDB with batch file
-        result = subprocess.run(
-            f'../zig-out/bin/nubdt < {batch_file}',
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=3,
-            cwd=os.path.dirname(__file__) or '.'
-        )
-        
-        # Parse output - filter out prompts and system messages
-        responses = []
-        for line in result.stdout.split('\n'):
-            line = line.strip()
-            if line and not any(x in line for x in [
-                '>', 'NubDB', 'Initializing', 'Replaying', 
-                'Database ready', 'Syncing', 'Goodbye', 'Compaction'
-            ]):
-                responses.append(line)
-        
-        return responses
-    finally:
-        # Clean up
-        os.unlink(batch_file)
+    # The commands are already in memory; pipe them straight to stdin
+    # instead of round-tripping through a temporary file and a shell
+    proc = subprocess.Popen(
+        ['../zig-out/bin/nubdt'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        cwd=os.path.dirname(__file__) or '.',
+        close_fds=False
+    )
+    payload = '\n'.join(commands) + '\nQUIT\n'
+
+    # Feed stdin from a helper thread while this thread streams the
+    # replies; writing the whole payload up front would deadlock once
+    # a large batch's unread replies fill the pipe
+    def _feed():
+        try:
+            proc.stdin.write(payload)
+            proc.stdin.close()
+        except BrokenPipeError:
+            pass
+
+    writer = threading.Thread(target=_feed, daemon=True)
+    writer.start()
+
+    # Stream the output, filtering prompts and system messages as the
+    # lines arrive rather than buffering the whole stdout first. The
+    # prompt is stripped first because responses arrive on the prompt
+    # line itself ('> OK').
+    responses = []
+    for line in proc.stdout:
+        line = line.strip().lstrip('> ')
+        if line and not _BANNER_RE.match(line):
+            responses.append(line)
+    proc.stdout.close()
+    proc.wait(timeout=3)
+    writer.join(timeout=3)
+
+    return responses
 
 def main():
     print("╔════════════════════════════════════════════╗")